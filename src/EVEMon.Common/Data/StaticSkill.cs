@@ -18,6 +18,7 @@ namespace EVEMon.Common.Data
     public sealed class StaticSkill : IStaticSkill
     {
         private static StaticSkill s_unknownStaticSkill;
+        private long[] m_pointsRequiredForLevel;
 
 
         #region Constructors
@@ -203,6 +204,47 @@ namespace EVEMon.Common.Data
         /// <returns>The required nr. of points.</returns>
         /// <exception cref="NotImplementedException"></exception>
         public long GetPointsRequiredForLevel(long level)
+        {
+            if (level < -1 || level > 5)
+                throw new NotImplementedException($"One of our devs messed up. Skill level was {level} ?!");
+
+            if (level <= 0)
+                return 0;
+
+            // The rank never changes, so the five levels are computed once and reused
+            if (m_pointsRequiredForLevel == null)
+            {
+                long[] points = new long[6];
+                for (int i = 1; i <= 5; i++)
+                {
+                    points[i] = ComputePointsRequiredForLevel(i);
+                }
+                m_pointsRequiredForLevel = points;
+            }
+
+            return m_pointsRequiredForLevel[level];
+        }
+
+        /// <summary>
+        /// Calculates the cumulative points required for a level of this skill (starting from a zero level).
+        /// </summary>
+        /// <param name="level">The level.</param>
+        /// <returns>The required nr. of points.</returns>
+        public long GetPointsRequiredForLevelOnly(int level)
+        {
+            if (level == 0)
+                return 0;
+
+            return GetPointsRequiredForLevel(level) - GetPointsRequiredForLevelOnly(level - 1);
+        }
+
+        /// <summary>
+        /// Computes the cumulative points required for a level of this skill from its rank.
+        /// </summary>
+        /// <param name="level">The level.</param>
+        /// <returns>The required nr. of points.</returns>
+        /// <exception cref="NotImplementedException"></exception>
+        private long ComputePointsRequiredForLevel(long level)
         {
             // Much faster than the old formula. This one too may have 1pt difference here and there, only on the lv2 skills
             switch (level)
@@ -231,19 +273,6 @@ namespace EVEMon.Common.Data
             }
         }
 
-        /// <summary>
-        /// Calculates the cumulative points required for a level of this skill (starting from a zero level).
-        /// </summary>
-        /// <param name="level">The level.</param>
-        /// <returns>The required nr. of points.</returns>
-        public long GetPointsRequiredForLevelOnly(int level)
-        {
-            if (level == 0)
-                return 0;
-
-            return GetPointsRequiredForLevel(level) - GetPointsRequiredForLevelOnly(level - 1);
-        }
-
         #endregion
 
 